@@ -1,11 +1,60 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import polars as pl
+import numpy as np
+from numba import njit
 import re
+import io
+import hashlib
+import threading
+import pyarrow as pa
 
 # ==========================================
 # STEP 1: SMART DATA LOADER
 # ==========================================
+def _read_excel(file_bytes, **kwargs):
+    # calamine (Rust) is much faster than openpyxl; fall back if it isn't installed
+    try:
+        return pd.read_excel(io.BytesIO(file_bytes), engine='calamine', **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_excel(io.BytesIO(file_bytes), **kwargs)
+
+def _read_csv(file_bytes, **kwargs):
+    # pyarrow's multithreaded parser + Arrow strings; fall back to the C parser
+    try:
+        return pd.read_csv(io.BytesIO(file_bytes), engine='pyarrow', dtype_backend='pyarrow', **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(io.BytesIO(file_bytes), **kwargs)
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _parse(file_bytes, name):
+    # Pure parser: keyed on the raw upload bytes so reruns skip re-reading the file
+    # 1. Read the whole file once without a header
+    if name.endswith('.csv'):
+        raw = _read_csv(file_bytes, header=None)
+    else:
+        raw = _read_excel(file_bytes, header=None)
+
+    # 2. Search for 'Plate Number' in the first rows
+    flat = raw.head(20).astype(str).apply(lambda col: col.str.lower().str.replace(' ', '', regex=False))
+    row_has = flat.apply(lambda col: col.str.contains('platenumber', regex=False)).any(axis=1)
+    header_row_index = int(row_has.idxmax()) if row_has.any() else -1
+
+    if header_row_index == -1:
+        return None
+
+    # 3. Promote the header row in memory instead of re-reading the file
+    df = raw.iloc[header_row_index + 1:].reset_index(drop=True)
+    # Same naming rules as a header read: blanks become "Unnamed: i", repeats get ".n"
+    names, seen = [], {}
+    for i, value in enumerate(raw.iloc[header_row_index]):
+        name = str(value) if pd.notna(value) else f'Unnamed: {i}'
+        count = seen.get(name, 0)
+        seen[name] = count + 1
+        names.append(name if count == 0 else f'{name}.{count}')
+    df.columns = names
+    return df.infer_objects()
+
 def load_data():
     # Add a Readme expander to explain the methodology (Interview Best Practice)
         
@@ -14,32 +63,15 @@ def load_data():
     
     if uploaded_file is not None:
         try:
-            # 1. Peek at file to find header
-            try:
-                df_temp = pd.read_excel(uploaded_file, header=None, nrows=20)
-            except:
-                uploaded_file.seek(0)
-                df_temp = pd.read_csv(uploaded_file, header=None, nrows=20)
-
-            # 2. Search for 'Plate Number'
-            header_row_index = -1
-            for index, row in df_temp.iterrows():
-                row_str = row.astype(str).str.lower().str.replace(' ', '')
-                if row_str.str.contains('platenumber').any():
-                    header_row_index = index
-                    break
+            file_bytes = uploaded_file.getvalue()
+            df = _parse(file_bytes, uploaded_file.name)
             
-            if header_row_index == -1:
+            if df is None:
                 st.error("❌ Critical Error: Could not find 'Plate Number' column.")
                 return None
 
-            # 3. Reload with correct header
-            uploaded_file.seek(0)
-            if uploaded_file.name.endswith('.csv'):
-                 df = pd.read_csv(uploaded_file, header=header_row_index)
-            else:
-                 df = pd.read_excel(uploaded_file, header=header_row_index)
-
+            # Content key used to look up the cleaned copy of this upload
+            df.attrs['source_key'] = hashlib.sha1(file_bytes).hexdigest()
             return df
 
         except Exception as e:
@@ -50,126 +82,200 @@ def load_data():
 # ==========================================
 # STEP 2: HYGIENE & CLASSIFICATION LAYER
 # ==========================================
+# Audit codes produced by _audit_odometer index into these
+AUDIT_STATUSES = ["Pass", "Manual Entry Error", "Sensor Error"]
+AUDIT_NOTES = ["", "Total corrected based on Odometer.", "End Km < Start Km. Check Odometer."]
+
+@njit(cache=True)
+def _audit_odometer(start_km, end_km, total_km, tolerance):
+    # One pass: 0 = pass, 1 = manual entry error (total corrected), 2 = sensor error
+    status = np.zeros(start_km.size, dtype=np.int8)
+    corrected = total_km.copy()
+    for i in range(start_km.size):
+        # 1. Identify Sensor Errors (Negative Distance)
+        if end_km[i] < start_km[i]:
+            status[i] = 2
+        else:
+            # 2. Identify Manual Entry Errors (Math Mismatch)
+            calculated = end_km[i] - start_km[i]
+            if abs(total_km[i] - calculated) > tolerance:
+                status[i] = 1
+                # FIX: Auto-correct only reasonable errors, not massive corruptions
+                corrected[i] = calculated
+    return status, corrected
+
 def clean_and_process_data(df):
+    # Cleaning runs in Polars; the result goes back to pandas for display/export
+    # Mixed object columns (e.g. numeric plates next to text) must be strings for Polars
+    object_cols = df.select_dtypes(include='object').columns
+    df = df.astype({col: 'string' for col in object_cols})
+
     # Standardize Columns
-    df.columns = df.columns.astype(str).str.strip().str.lower().str.replace(' ', '_')
+    lf = pl.from_pandas(df).lazy()
+    lf = lf.rename({c: c.strip().lower().replace(' ', '_') for c in df.columns})
+    columns = lf.collect_schema().names()
     
     # --------------------------------------
     # SAFETY NET (FORMATTING)
     # --------------------------------------
     # Force Plate Number to string and remove ".0" artifacts from Excel
-    if 'plate_number' in df.columns:
-        df['plate_number'] = df['plate_number'].astype(str).str.replace(r'\.0$', '', regex=True)
+    if 'plate_number' in columns:
+        lf = lf.with_columns(pl.col('plate_number').cast(pl.String).str.strip_suffix('.0'))
 
     # --------------------------------------
     # FIX: REMOVE SUMMARY / FOOTER ROWS
     # --------------------------------------
     # We drop rows where 'plate_number' is missing (NaN)
-    if 'plate_number' in df.columns:
-        df = df.dropna(subset=['plate_number'])
+    if 'plate_number' in columns:
+        lf = lf.drop_nulls(subset=['plate_number'])
         
         # Double check: Remove rows where 'location' says "Total Mileage Covered"
-        if 'location' in df.columns:
-            df = df[~df['location'].astype(str).str.contains("Total Mileage", case=False, na=False)]
+        if 'location' in columns:
+            is_footer = pl.col('location').cast(pl.String).str.to_lowercase().str.contains('total mileage', literal=True)
+            lf = lf.filter(~is_footer.fill_null(False))
             
     # Numeric Conversion
-    for col in ['start_km', 'end_km', 'total_km']:
-        if col in df.columns:
-             df[col] = pd.to_numeric(df[col], errors='coerce')
+    km_cols = [col for col in ['start_km', 'end_km', 'total_km'] if col in columns]
+    # Odometer readings (~10^6 km with decimals) need float64; trip distances fit float32
+    km_types = {'start_km': pl.Float64, 'end_km': pl.Float64, 'total_km': pl.Float32}
+    # Text readings may carry padding (" 1000 ") that the cast would turn into nulls
+    schema = lf.collect_schema()
+    km_values = {col: pl.col(col).str.strip_chars() if schema[col] == pl.String else pl.col(col) for col in km_cols}
+    lf = lf.with_columns(km_values[col].cast(km_types[col], strict=False) for col in km_cols)
     
     # Feature Extraction: Status
-    if 'plate_number' in df.columns:
-        def extract_status(val):
-            val = str(val).upper()
-            if 'BACKUP' in val:
-                return "⚠️ Depot Backup"
-            elif 'TRANSFER' in val:
-                return "🔄 Transfer"
-            elif 'RT-' in val or 'ROUTE' in val:
-                return "🚚 On Route"
-            elif 'SALES' in val:
-                return "💰 For Sales/Decision"
-            else:
-                return "✅ Active Standard"
-        df['operational_status'] = df['plate_number'].apply(extract_status)
+    if 'plate_number' in columns:
+        plate = pl.col('plate_number').str.to_uppercase()
+        lf = lf.with_columns(
+            pl.when(plate.str.contains('BACKUP', literal=True)).then(pl.lit("⚠️ Depot Backup"))
+            .when(plate.str.contains('TRANSFER', literal=True)).then(pl.lit("🔄 Transfer"))
+            .when(plate.str.contains('RT-', literal=True) | plate.str.contains('ROUTE', literal=True)).then(pl.lit("🚚 On Route"))
+            .when(plate.str.contains('SALES', literal=True)).then(pl.lit("💰 For Sales/Decision"))
+            .otherwise(pl.lit("✅ Active Standard"))
+            .alias('operational_status')
+        )
     else:
-        df['operational_status'] = "Unknown"
+        lf = lf.with_columns(pl.lit("Unknown").alias('operational_status'))
+
+    # Small fixed vocabularies: store as categories for cheaper filters/counts
+    df = lf.with_columns(pl.col('operational_status').cast(pl.Categorical)).collect().to_pandas()
 
     # --------------------------------------
     # FEATURE: AUDIT & AUTO-CORRECTION
     # --------------------------------------
-    df['audit_status'] = "Pass"
-    df['audit_notes'] = ""
-    
-    if 'total_km' in df.columns and 'start_km' in df.columns and 'end_km' in df.columns:
-        df['calculated_total'] = df['end_km'] - df['start_km']
+    if len(km_cols) == 3:
         tolerance = 1.0 
-        
-        # 1. Identify Sensor Errors (Negative Distance)
-        sensor_error_mask = (df['end_km'] < df['start_km'])
-        df.loc[sensor_error_mask, 'audit_status'] = "Sensor Error"
-        df.loc[sensor_error_mask, 'audit_notes'] = "End Km < Start Km. Check Odometer."
-        
-        # 2. Identify Manual Entry Errors (Math Mismatch)
-        math_error_mask = (
-            (~sensor_error_mask) & 
-            (abs(df['total_km'] - df['calculated_total']) > tolerance)
-        )
-        
-        if math_error_mask.any():
-            df.loc[math_error_mask, 'audit_status'] = "Manual Entry Error"
-            df.loc[math_error_mask, 'audit_notes'] = "Total corrected based on Odometer."
-            # FIX: Auto-correct only reasonable errors, not massive corruptions
-            df.loc[math_error_mask, 'total_km'] = df.loc[math_error_mask, 'calculated_total']
+        start_km, end_km = df['start_km'].to_numpy(), df['end_km'].to_numpy()
+        codes, total_km = _audit_odometer(start_km, end_km, df['total_km'].to_numpy(), tolerance)
+    else:
+        codes = np.zeros(len(df), dtype=np.int8)
+
+    df['audit_status'] = pd.Categorical.from_codes(codes, categories=AUDIT_STATUSES)
+    df['audit_notes'] = pd.Categorical.from_codes(codes, categories=AUDIT_NOTES)
+    if len(km_cols) == 3:
+        df['total_km'] = total_km
+        # Appended last so the export keeps its original column order
+        df['calculated_total'] = (end_km - start_km).astype('float32')
+
+    return df
+
+@st.cache_resource
+def _cleaned_store():
+    # Process-wide {source_key: (Arrow IPC buffer, filter options)} of cleaned uploads, plus its lock.
+    # Created here because Streamlit re-executes this module on every rerun.
+    return {}, threading.Lock()
+
+def load_processed_data(raw_df, max_entries=4):
+    # Reuse the cleaned Arrow copy of this upload; clean only on first sight
+    store, store_lock = _cleaned_store()
+    source_key = raw_df.attrs.get('source_key')
+    with store_lock:
+        entry = store.get(source_key)
+    if entry is not None:
+        buffer, options = entry
+        df = pa.ipc.open_stream(buffer).read_all().to_pandas()
+    else:
+        df = clean_and_process_data(raw_df)
+        options = _filter_options(df)
+        if source_key is not None:
+            table = pa.Table.from_pandas(df)
+            sink = pa.BufferOutputStream()
+            with pa.ipc.new_stream(sink, table.schema) as writer:
+                writer.write_table(table)
+            # The store is shared by every session thread, so guard insert + eviction
+            with store_lock:
+                store[source_key] = (sink.getvalue(), options)
+                while len(store) > max_entries:
+                    store.pop(next(iter(store)))
 
+    # Per-upload results travel with the frame so reruns don't recompute them
+    df.attrs.update(source_key=source_key, filter_options=options)
     return df
 
 # ==========================================
 # STEP 3: INTERACTIVITY (FILTERS)
 # ==========================================
+def _filter_options(df):
+    # Sorted dropdown values per filter column, computed once per upload
+    options = {}
+    if 'operational_status' in df.columns:
+        options['operational_status'] = sorted(df['operational_status'].unique().tolist())
+    for col in ['make', 'location']:
+        if col in df.columns:
+            options[col] = sorted(df[col].dropna().astype(str).unique().tolist())
+    return options
+
 def apply_filters(df):
     st.sidebar.markdown("---")
     st.sidebar.header("🔍 Filter Options")
     
-    filtered_df = df.copy()
+    options = df.attrs.get('filter_options') or _filter_options(df)
+    # Accumulate one boolean mask and slice once at the end
+    mask = np.ones(len(df), dtype=bool)
     
     # Filter 1: Audit Status
     audit_opts = ['All', 'Pass', 'Manual Entry Error', 'Sensor Error']
     selected_audit = st.sidebar.selectbox("🛡️ Audit Filter", audit_opts)
     if selected_audit != 'All':
-        filtered_df = filtered_df[filtered_df['audit_status'] == selected_audit]
+        mask &= (df['audit_status'] == selected_audit).to_numpy(dtype=bool, na_value=False)
 
     # Filter 2: Operational Status
     if 'operational_status' in df.columns:
-        statuses = ['All'] + sorted(df['operational_status'].unique().tolist())
+        statuses = ['All'] + options['operational_status']
         selected_status = st.sidebar.selectbox("🚦 Select Status", statuses)
         if selected_status != 'All':
-            filtered_df = filtered_df[filtered_df['operational_status'] == selected_status]
+            mask &= (df['operational_status'] == selected_status).to_numpy(dtype=bool, na_value=False)
 
     # Filter 3: Make (RESTORED)
     if 'make' in df.columns:
-        makes = ['All'] + sorted(df['make'].dropna().astype(str).unique().tolist())
+        makes = ['All'] + options['make']
         selected_make = st.sidebar.selectbox("🚗 Select Make", makes)
         if selected_make != 'All':
-            filtered_df = filtered_df[filtered_df['make'].astype(str) == selected_make]
+            mask &= (df['make'].astype(str) == selected_make).to_numpy(dtype=bool, na_value=False)
 
     # Filter 4: Location
     if 'location' in df.columns:
-        locations = ['All'] + sorted(df['location'].dropna().astype(str).unique().tolist())
+        locations = ['All'] + options['location']
         selected_loc = st.sidebar.selectbox("📍 Select Location", locations)
         if selected_loc != 'All':
-            filtered_df = filtered_df[filtered_df['location'].astype(str) == selected_loc]
+            mask &= (df['location'].astype(str) == selected_loc).to_numpy(dtype=bool, na_value=False)
             
-    return filtered_df
+    filtered = df[mask]
+    # Together with source_key this identifies the slice exactly (for the export cache)
+    filtered.attrs['row_mask'] = hashlib.sha1(np.packbits(mask)).hexdigest()
+    return filtered
 
 # ==========================================
 # STEP 4: INTELLIGENCE & REPORTING
 # ==========================================
 def visualize_fleet_intelligence(df):
+    # Deferred so the loader/filters don't pay for importing plotly
+    import plotly.express as px
+
     st.markdown("---")
     
     # 1. Scorecard
-    total_distance = df['total_km'].sum() if 'total_km' in df.columns else 0
+    total_distance = np.nansum(df['total_km'].to_numpy(), dtype='float64') if 'total_km' in df.columns else 0
     active_vehicles = df['plate_number'].nunique() if 'plate_number' in df.columns else 0
     
     error_counts = df['audit_status'].value_counts()
@@ -189,7 +295,9 @@ def visualize_fleet_intelligence(df):
     with col_brand:
         st.subheader("🏭 Which manufacturers dominate our fleet?") 
         if 'make' in df.columns:
-            fig_brand = px.pie(df, names='make', hole=0.4, 
+            make_counts = df['make'].value_counts().reset_index()
+            make_counts.columns = ['make', 'count']
+            fig_brand = px.pie(make_counts, values='count', names='make', hole=0.4, 
                                color_discrete_sequence=px.colors.qualitative.Prism)
             st.plotly_chart(fig_brand, use_container_width=True)
     with col_loc:
@@ -207,7 +315,8 @@ def visualize_fleet_intelligence(df):
     with col_status:
         st.caption("Breakdown of Fleet Roles")
         if 'operational_status' in df.columns:
-            status_counts = df['operational_status'].value_counts().reset_index()
+            status_counts = df['operational_status'].value_counts()
+            status_counts = status_counts[status_counts > 0].reset_index()
             status_counts.columns = ['Status', 'Count']
             fig_status = px.bar(status_counts, x='Count', y='Status', text='Count',
                                 color='Status', color_discrete_sequence=px.colors.qualitative.Safe)
@@ -215,68 +324,84 @@ def visualize_fleet_intelligence(df):
     with col_matrix:
         st.caption("Role Distribution per Branch")
         if 'location' in df.columns:
-            fig_matrix = px.histogram(df, x="location", color="operational_status", 
-                                      barmode='group')
+            matrix_counts = df.groupby(['location', 'operational_status'], observed=True).size().reset_index(name='count')
+            fig_matrix = px.bar(matrix_counts, x="location", y="count", color="operational_status", 
+                                barmode='group')
             st.plotly_chart(fig_matrix, use_container_width=True)
 
     # 4. Charts Row 3: Advanced Asset Utilization
     st.markdown("---")
     st.subheader("🚀 Are we overworking or underusing our assets?")
     
-    tab1, tab2, tab3 = st.tabs(["📊 Distribution (Histogram)", "🏆 Top/Bottom Performers", "📦 Status Analysis (Box Plot)"])
+    # Tabs track the selection so only the visible tab's content is built
+    tab1, tab2, tab3 = st.tabs(["📊 Distribution (Histogram)", "🏆 Top/Bottom Performers", "📦 Status Analysis (Box Plot)"],
+                               key='utilization_tab', on_change='rerun')
     
     # Tab 1: Histogram
     with tab1:
-        st.caption("Identify 'Idle' vs 'Overworked' groups.")
-        if 'total_km' in df.columns:
-            fig_hist = px.histogram(df, x="total_km", nbins=20, title="Distance Distribution",
-                                    color_discrete_sequence=['#3366CC'])
-            fig_hist.update_layout(bargap=0.1)
-            st.plotly_chart(fig_hist, use_container_width=True)
+        if tab1.open:
+            st.caption("Identify 'Idle' vs 'Overworked' groups.")
+            if 'total_km' in df.columns:
+                km = df['total_km'].dropna().to_numpy()
+                counts, edges = np.histogram(km, bins=20)
+                hist_df = pd.DataFrame({'total_km': (edges[:-1] + edges[1:]) / 2, 'count': counts})
+                fig_hist = px.bar(hist_df, x="total_km", y="count", title="Distance Distribution",
+                                  color_discrete_sequence=['#3366CC'])
+                fig_hist.update_layout(bargap=0.1)
+                st.plotly_chart(fig_hist, use_container_width=True)
             
     # Tab 2: Top/Bottom lists
     with tab2:
-        col_top, col_bot = st.columns(2)
-        if 'plate_number' in df.columns and 'total_km' in df.columns:
-            sorted_df = df.sort_values(by='total_km', ascending=False)
-            with col_top:
-                st.write("🔥 **Top 5 Highest Utilization**")
+        if tab2.open:
+            col_top, col_bot = st.columns(2)
+            if 'plate_number' in df.columns and 'total_km' in df.columns:
+                # Partial selection instead of sorting the whole frame
                 cols = ['plate_number', 'make', 'total_km', 'operational_status']
-                st.dataframe(sorted_df[cols].head(5), hide_index=True)
-            with col_bot:
-                st.write("🧊 **Top 5 Lowest Utilization**")
-                st.dataframe(sorted_df[cols].tail(5), hide_index=True)
+                with col_top:
+                    st.write("🔥 **Top 5 Highest Utilization**")
+                    st.dataframe(df.nlargest(5, 'total_km')[cols], hide_index=True)
+                with col_bot:
+                    st.write("🧊 **Top 5 Lowest Utilization**")
+                    st.dataframe(df.nsmallest(5, 'total_km')[cols], hide_index=True)
                 
     # Tab 3: Status Box Plot
     with tab3:
-        st.caption("Does 'Backup' status actually mean low mileage?")
-        if 'operational_status' in df.columns and 'total_km' in df.columns:
-            fig_box_stat = px.box(df, x='operational_status', y='total_km', color='operational_status',
-                                  points="all", title="Utilization by Operational Role")
-            st.plotly_chart(fig_box_stat, use_container_width=True)
+        if tab3.open:
+            st.caption("Does 'Backup' status actually mean low mileage?")
+            if 'operational_status' in df.columns and 'total_km' in df.columns:
+                fig_box_stat = px.box(df, x='operational_status', y='total_km', color='operational_status',
+                                      points="all", title="Utilization by Operational Role")
+                st.plotly_chart(fig_box_stat, use_container_width=True)
 
     # 5. Detailed Data View with HIGHLIGHTS (COLLAPSIBLE)
     st.markdown("---")
     with st.expander("📋 Detailed Fleet Audit (Click to View Data)"):
-        st.caption("Rows highlighted in **RED** indicate errors. Manual errors have been auto-corrected.")
+        st.caption("Flagged rows: **RED** status indicates a sensor error. Manual errors (orange) have been auto-corrected.")
         
-        def highlight_rows(row):
-            color = ''
-            if row['audit_status'] == 'Sensor Error':
-                color = 'background-color: #ffcccc' # Light Red
-            elif row['audit_status'] == 'Manual Entry Error':
-                color = 'background-color: #fff4e6' # Light Orange
-            return [color] * len(row)
-
         cols_to_show = ['plate_number', 'make', 'location', 'start_km', 'end_km', 'total_km', 'operational_status', 'audit_status', 'audit_notes']
         final_cols = [c for c in cols_to_show if c in df.columns]
-        
-        styled_df = df[final_cols].style.apply(highlight_rows, axis=1)
+        is_pass = (df['audit_status'] == 'Pass').to_numpy()
+        error_df = df.loc[~is_pass, final_cols]
+
+        # Style only the audit_status cells of the (usually small) error subset
+        audit_status = error_df['audit_status'].to_numpy()
+        status_colors = np.where(audit_status == 'Sensor Error', 'background-color: #ffcccc', # Light Red
+                                 'background-color: #fff4e6') # Light Orange
+        styled_df = error_df.style.apply(lambda _: status_colors, axis=0, subset=['audit_status'])
         st.dataframe(styled_df, use_container_width=True)
 
+    # Passing rows need no highlighting, so they skip the Styler entirely
+    with st.expander(f"✅ Passing Records ({int(is_pass.sum())})"):
+        st.dataframe(df.loc[is_pass, final_cols], use_container_width=True)
+
 # ==========================================
 # MAIN APP FLOW
 # ==========================================
+@st.cache_data(max_entries=4, show_spinner=False)
+def _to_csv_bytes(source_key, row_mask, _df):
+    # Keyed on the upload + kept rows; the leading underscore stops Streamlit hashing the frame
+    return _df.to_csv(index=False).encode('utf-8')
+
 def main():
     st.set_page_config(page_title="ATS Fleet Tool", layout="wide")
     st.title("🚛 ATS Fleet Audit & Intelligence Tool")
@@ -284,7 +409,7 @@ def main():
     raw_data = load_data()
     
     if raw_data is not None:
-        processed_data = clean_and_process_data(raw_data)
+        processed_data = load_processed_data(raw_data)
         
         if processed_data is not None:
             filtered_data = apply_filters(processed_data)
@@ -296,7 +421,7 @@ def main():
             
             st.markdown("---")
             st.subheader("📥 Export Audited Data")
-            csv_buffer = filtered_data.to_csv(index=False).encode('utf-8')
+            csv_buffer = _to_csv_bytes(filtered_data.attrs.get('source_key'), filtered_data.attrs.get('row_mask'), filtered_data)
             st.download_button("Download Audit Report (CSV)", csv_buffer, "fleet_audit_report.csv", "text/csv")
 
 if __name__ == "__main__":